@@ -1,12 +1,210 @@
 import os
+import json
+import tempfile
 import struct
 import random
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 import eventio
 import matplotlib.pyplot as plt
 from matplotlib.collections import LineCollection
 
+# numba is optional and only speeds up reading irregular track files
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Layout of a single Fortran record in the CORSIKA track files: a 4-byte
+# record marker, ten 4-byte floats and the repeated 4-byte record marker
+_TRACK_RECORD_DTYPE = np.dtype([("m1", "<i4"), ("d", "<f4", (10,)), ("m2", "<i4")])
+_TRACK_PAYLOAD_BYTES = 40
+
+# Parsed data is cached in this directory next to the simulation output. The
+# version is bumped whenever the layout of the cached arrays changes
+_CACHE_DIR_NAME = ".showerpy_cache"
+_CACHE_VERSION = 2
+
+# Names of the ten payload values of a track record
+_TRACK_COLUMNS = [
+    "particle_id",
+    "energy_gev",
+    "x_start",
+    "y_start",
+    "z_start",
+    "t_start",
+    "x_end",
+    "y_end",
+    "z_end",
+    "t_end",
+]
+
+# Precompiled layout of a full record for the record-by-record fallback readers
+_TRACK_RECORD = struct.Struct("<i10fi")
+_TRACK_RECORD_WORDS = _TRACK_RECORD.size // 4
+
+
+def _raise_marker_error(marker1, marker2):
+    """
+    Raises the error for a track record with invalid Fortran record markers.
+
+    Args:
+        marker1 (int): Leading record marker.
+        marker2 (int): Trailing record marker.
+
+    Raises:
+        ValueError: Always, describing which marker check failed.
+    """
+    if marker1 != marker2:
+        raise ValueError(f"Fortran record markers do not match: {marker1} vs {marker2}")
+    raise ValueError(f"Unexpected Fortran record size: {marker1} (expected {_TRACK_PAYLOAD_BYTES})")
+
+
+def _read_track_file(path):
+    """
+    Reads the record payloads of a CORSIKA particle track file.
+
+    Args:
+        path (str): Path to the track file.
+
+    Returns:
+        np.ndarray: Array of shape (N, 10) with the float32 payload of each record,
+            as a read-only view into the memory-mapped file.
+
+    Raises:
+        ValueError: If the Fortran record markers are invalid.
+    """
+    file_size = os.path.getsize(path)
+    if file_size == 0:
+        return np.empty((0, 10), dtype=np.float32)
+
+    # Files that hold only complete records are mapped in one go, anything else
+    # (e.g. a truncated last record) goes through the record-by-record reader
+    if file_size % _TRACK_RECORD_DTYPE.itemsize != 0:
+        return _read_track_file_records(path)
+
+    # Parse data in accordance with the official CORSIKA/EVENTIO Documentation.
+    # The memory map is only paged in where the data is accessed, the returned
+    # payload is a view into it
+    records = np.memmap(path, dtype=_TRACK_RECORD_DTYPE, mode="r")
+
+    # Validate all record markers at once instead of record by record
+    invalid = (records["m1"] != _TRACK_PAYLOAD_BYTES) | (records["m1"] != records["m2"])
+    if invalid.any():
+        _raise_marker_error(*records[["m1", "m2"]][np.argmax(invalid)])
+
+    return records["d"]
+
+
+def _read_track_file_records(path):
+    """
+    Reads a CORSIKA particle track file record by record, stopping at the
+    first incomplete record.
+
+    Args:
+        path (str): Path to the track file.
+
+    Returns:
+        np.ndarray: Array of shape (N, 10) with the float32 payload of each record.
+
+    Raises:
+        ValueError: If the Fortran record markers are invalid.
+    """
+    if _scan_track_records is not None:
+        return _read_track_file_records_jit(path)
+
+    with open(path, "rb") as f:
+        buffer = f.read()
+
+    # Unpack all complete records in one C-level loop
+    n_records = len(buffer) // _TRACK_RECORD.size
+    records = _TRACK_RECORD.iter_unpack(memoryview(buffer)[:n_records * _TRACK_RECORD.size])
+
+    return np.fromiter(_iter_track_payloads(records), dtype=np.dtype((np.float32, 10)), count=n_records)
+
+
+def _iter_track_payloads(records):
+    """
+    Validates the markers of unpacked track records and yields their payloads.
+
+    Args:
+        records (iterable): Tuples of marker, ten payload values and marker.
+
+    Yields:
+        list: The ten payload values of each record.
+
+    Raises:
+        ValueError: If the Fortran record markers are invalid.
+    """
+    for marker1, *payload, marker2 in records:
+        if marker1 != marker2 or marker1 != _TRACK_PAYLOAD_BYTES:
+            _raise_marker_error(marker1, marker2)
+
+        yield payload
+
+
+def _read_track_file_records_jit(path):
+    """
+    Reads a CORSIKA particle track file record by record with the numba
+    compiled scanner, stopping at the first incomplete record.
+
+    Args:
+        path (str): Path to the track file.
+
+    Returns:
+        np.ndarray: Array of shape (N, 10) with the float32 payload of each record.
+
+    Raises:
+        ValueError: If the Fortran record markers are invalid.
+    """
+    with open(path, "rb") as f:
+        buffer = f.read()
+
+    # All fields are 4 bytes wide, so the file is scanned as 4-byte words
+    words = np.frombuffer(buffer, dtype="<i4", count=len(buffer) // 4)
+    values = words.view("<f4")
+
+    tracks = np.empty((len(buffer) // _TRACK_RECORD.size, 10), dtype=np.float32)
+    n_records, invalid_position = _scan_track_records(words, values, tracks)
+
+    if invalid_position >= 0:
+        _raise_marker_error(words[invalid_position], words[invalid_position + _TRACK_RECORD_WORDS - 1])
+
+    return tracks[:n_records]
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _scan_track_records(words, values, out):
+        """
+        Copies the payload of consecutive track records into `out`.
+
+        Args:
+            words (np.ndarray): File content as int32 words.
+            values (np.ndarray): File content as float32 words.
+            out (np.ndarray): Preallocated (N, 10) float32 output array.
+
+        Returns:
+            tuple: Number of records read and the word position of the first
+                invalid record, or -1 if all records are valid.
+        """
+        n_records = 0
+        position = 0
+        while position + _TRACK_RECORD_WORDS <= len(words):
+            marker1 = words[position]
+            if marker1 != words[position + _TRACK_RECORD_WORDS - 1] or marker1 != _TRACK_PAYLOAD_BYTES:
+                return n_records, position
+
+            out[n_records, :] = values[position + 1:position + _TRACK_RECORD_WORDS - 1]
+            n_records += 1
+            position += _TRACK_RECORD_WORDS
+
+        return n_records, -1
+else:
+    _scan_track_records = None
+
 
 class CorsikaPlotter:
     """
@@ -14,21 +212,46 @@ class CorsikaPlotter:
 
     Attributes:
         path_data (str): Path to the directory containing CORSIKA output files.
-        cherenkov_photons (pd.DataFrame or None): Parsed Cherenkov photon data.
-        particle_tracks (pd.DataFrame or None): Parsed particle track data.
+        cherenkov_photons (pd.DataFrame): Parsed Cherenkov photon data, read from the
+            Cherenkov file on first access. Assigning a filtered frame updates the plots.
+        particle_tracks (pd.DataFrame): Parsed particle track data grouped by particle ID,
+            built on first access. Its columns share memory with the plotting data and
+            are read-only, modify a copy instead. Assigning a filtered or modified frame
+            updates the plots.
         file_paths (dict): Dictionary storing available file paths for different data types.
     """
 
-    def __init__(self, path_data):
+    def __init__(self, path_data, use_cache=False):
         """
         Initializes the CorsikaPlotter and loads available data.
 
         Args:
             path_data (str): Path to the directory containing CORSIKA simulation output.
+            use_cache (bool, optional): If `True`, a float32 copy of the parsed data is
+                stored as .npy files in a `.showerpy_cache` subdirectory of `path_data`
+                and loaded from there as long as the simulation files are unchanged.
+                Defaults to `False`.
         """
         self.path_data = path_data
-        self.cherenkov_photons = None
-        self.particle_tracks = None
+        self._path_cache = os.path.join(path_data, _CACHE_DIR_NAME)
+        
+        # Column-major float32 (N, 2) array of the photon impact positions in km
+        # used for plotting, the full Cherenkov DataFrame is built lazily
+        self._cher_xy = None
+        self._cherenkov_photons_df = None
+        
+        # Column-major float32 buffer of the particle tracks sorted by particle
+        # ID, the column of each track quantity, the int32 particle IDs and the
+        # (start, stop) rows of each particle ID. The DataFrame is built lazily
+        self._tracks = None
+        self._col = {name: i for i, name in enumerate(_TRACK_COLUMNS)}
+        self._pid = None
+        self._slice_of = {}
+        self._particle_tracks_df = None
+        
+        # Black background segments of the last side profile, keyed by the set
+        # of colored particle IDs they exclude
+        self._other_segments_cache = (None, None)
         
         # Mapping between CORSIKA particle ID and particle name
         self.particle_map = {
@@ -75,9 +298,58 @@ class CorsikaPlotter:
 
         self._check_available_files()
 
-        # Load data into pandas DataFrames
-        self.cherenkov_photons = self._parse_cherenkov_data()
-        self.particle_tracks = self._parse_particle_data()
+        # Load data into numpy arrays, either from the cache or by parsing the
+        # simulation output. The pandas DataFrames are built on first access
+        # Note: the file state is taken before parsing, so files that change while
+        # they are parsed do not match the cache on the next load
+        cache_state = self._get_cache_state() if use_cache else None
+        if not (use_cache and self._load_cache(cache_state)):
+            self._cher_xy = self._get_cherenkov_impacts(self._parse_cherenkov_data())
+            self._tracks = self._parse_particle_data()
+            self._index_particle_tracks(self._tracks)
+
+            if use_cache:
+                self._save_cache(cache_state)
+
+    @property
+    def cherenkov_photons(self):
+        """pd.DataFrame: Cherenkov photon information, read from the Cherenkov file on first access."""
+        if self._cherenkov_photons_df is None:
+            self._cherenkov_photons_df = pd.DataFrame(self._parse_cherenkov_data(), copy=False)
+        return self._cherenkov_photons_df
+
+    @cherenkov_photons.setter
+    def cherenkov_photons(self, cherenkov_photons):
+        # Replacing the photons, e.g. after applying cuts, also updates the plotted impacts
+        self._cher_xy = self._get_cherenkov_impacts(cherenkov_photons)
+        self._cherenkov_photons_df = cherenkov_photons
+
+    @property
+    def particle_tracks(self):
+        """pd.DataFrame: Read-only particle track information grouped by particle ID, built on first access."""
+        if self._particle_tracks_df is None and self._tracks is not None:
+            # The buffer columns are referenced without copying, only the
+            # particle ID column is replaced by its integer counterpart
+            columns = {name: self._tracks[:, column] for name, column in self._col.items()}
+            columns["particle_id"] = self._pid.view()
+
+            # Note: the columns are shared with the plotting state, so they are made
+            # read-only and writing to the frame raises instead of corrupting it
+            for values in columns.values():
+                values.setflags(write=False)
+            self._particle_tracks_df = pd.DataFrame(columns, copy=False)
+        return self._particle_tracks_df
+
+    @particle_tracks.setter
+    def particle_tracks(self, particle_tracks):
+        # Replacing the tracks, e.g. after applying cuts, rebuilds the track buffer
+        # and drops all state derived from the previous tracks
+        self._tracks = self._sort_particle_tracks(particle_tracks[_TRACK_COLUMNS].to_numpy(dtype=np.float32))
+        self._index_particle_tracks(self._tracks)
+        self._particle_tracks_df = None
+        self._other_segments_cache = (None, None)
+        self.__dict__.pop("shower_start", None)
+        self.__dict__.pop("_track_segments_km", None)
 
     def _check_available_files(self):
         """
@@ -86,11 +358,6 @@ class CorsikaPlotter:
         Raises:
             ValueError: If no CORSIKA files are found.
         """
-        try:
-            files = os.listdir(self.path_data)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Error: Directory '{self.path_data}' not found.")
-
         file_patterns = {
             "track_em": "em_data",
             "track_mu": "muon_data",
@@ -99,12 +366,17 @@ class CorsikaPlotter:
         }
 
         # Get paths of files
-        for file in files:
-            full_path = os.path.join(self.path_data, file)
-            if os.path.isfile(full_path):
-                for key, attr in file_patterns.items():
-                    if file.endswith(key):
-                        self.file_paths[attr] = full_path
+        # Note: the file type of a directory entry is known without an extra stat call
+        try:
+            with os.scandir(self.path_data) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    for key, attr in file_patterns.items():
+                        if entry.name.endswith(key):
+                            self.file_paths[attr] = entry.path
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Error: Directory '{self.path_data}' not found.")
 
         print("Looking for available files:")
         # Get longest filetype name so everything is printed nicely!
@@ -124,7 +396,7 @@ class CorsikaPlotter:
         Parses Cherenkov photon data from the CORSIKA output.
 
         Returns:
-            pd.DataFrame: DataFrame containing Cherenkov photon information.
+            dict: Mapping of column name to numpy array with Cherenkov photon information.
 
         Raises:
             ValueError: If the Cherenkov data file is missing.
@@ -140,8 +412,8 @@ class CorsikaPlotter:
         # Extract telescope position and photon bunches
         # Note: telescope position not interesting if we only have a single one
         telescope_position = pd.DataFrame(f.telescope_positions)
-        cherenkov_photons = pd.DataFrame(event.photon_bunches[0])
-        cherenkov_photons.columns = [
+        photon_bunches = event.photon_bunches[0]
+        columns = [
             "x_impact_cm",
             "y_impact_cm",
             "cos_incident_x",
@@ -152,73 +424,193 @@ class CorsikaPlotter:
             "wavelength_nm",
         ]
 
-        # Remove incorrectly parsed column
-        cherenkov_photons.drop(columns=["photons"], inplace=True)
+        # Keep the fields of the photon bunch array as separate columns and
+        # remove the incorrectly parsed one
+        cherenkov_photons = {
+            name: photon_bunches[field]
+            for name, field in zip(columns, photon_bunches.dtype.names)
+            if name != "photons"
+        }
 
         return cherenkov_photons
 
+    def _get_cherenkov_impacts(self, cherenkov_photons):
+        """
+        Extracts the photon impact positions needed for plotting.
+
+        Args:
+            cherenkov_photons (dict or pd.DataFrame): Cherenkov photon columns as returned
+                by `_parse_cherenkov_data`.
+
+        Returns:
+            np.ndarray: Column-major (N, 2) float32 array of the x and y impact positions in km.
+        """
+        impacts = np.empty((len(cherenkov_photons["x_impact_cm"]), 2), dtype=np.float32, order="F")
+        impacts[:, 0] = cherenkov_photons["x_impact_cm"] * 1e-5
+        impacts[:, 1] = cherenkov_photons["y_impact_cm"] * 1e-5
+        return impacts
+
     def _parse_particle_data(self):
         """
         Parses particle track data from simulation output files.
 
         Returns:
-            pd.DataFrame: A DataFrame containing particle track information.
+            np.ndarray: Column-major (N, 10) float32 array of the particle tracks,
+                sorted by particle ID.
         """
         print("\nParsing particle track data")
 
-        columns = [
-            "particle_id",
-            "energy_gev",
-            "x_start",
-            "y_start",
-            "z_start",
-            "t_start",
-            "x_end",
-            "y_end",
-            "z_end",
-            "t_end",
-        ]
+        particle_files = [path for path in list(self.file_paths.values())[:-1] if path is not None]
 
-        particle_tracks_df = pd.DataFrame(columns=columns)
+        for particle_file in particle_files:
+            print(f"\t-> Reading {os.path.basename(particle_file)}")
 
-        for particle_file in list(self.file_paths.values())[:-1]:
-            if particle_file is None:
-                continue
+        # The track files are independent, so they are read concurrently. Threads
+        # suffice as reading the memory-mapped files is I/O bound and numpy
+        # releases the GIL while validating the records
+        all_tracks = []
+        if particle_files:
+            with ThreadPoolExecutor(max_workers=len(particle_files)) as executor:
+                all_tracks = [tracks for tracks in executor.map(_read_track_file, particle_files) if tracks.size]
 
-            print(f"\t-> Reading {os.path.basename(particle_file)}")
+        if not all_tracks:
+            return np.empty((0, len(_TRACK_COLUMNS)), dtype=np.float32, order="F")
 
-            tracks = []
-            with open(particle_file, "rb") as f:
-                # Iterate over the Fortran file and parse data in accordance
-                # with the official CORSIKA/EVENTIO Documentation
-                while True:
-                    marker1_bytes = f.read(4)
-                    if len(marker1_bytes) < 4:
-                        break
+        return self._sort_particle_tracks(np.concatenate(all_tracks, axis=0))
 
-                    marker1 = struct.unpack("i", marker1_bytes)[0]
-                    data_bytes = f.read(marker1)
-                    if len(data_bytes) < marker1:
-                        break
+    def _sort_particle_tracks(self, tracks):
+        """
+        Brings particle tracks into the layout used for plotting.
 
-                    marker2_bytes = f.read(4)
-                    if len(marker2_bytes) < 4:
-                        break
-                    marker2 = struct.unpack("i", marker2_bytes)[0]
+        Args:
+            tracks (np.ndarray): (N, 10) float32 array of particle tracks.
 
-                    if marker1 != marker2:
-                        raise ValueError(f"Fortran record markers do not match: {marker1} vs {marker2}")
+        Returns:
+            np.ndarray: Column-major (N, 10) float32 array of the particle tracks,
+                sorted by particle ID.
+        """
+        # Store the tracks column by column so that every track quantity is a
+        # contiguous array. The tracks are grouped by particle ID so that every
+        # particle type is a contiguous slice
+        order = np.argsort(tracks[:, self._col["particle_id"]], kind="stable")
+        sorted_tracks = np.empty(tracks.shape, dtype=np.float32, order="F")
+        for column in range(tracks.shape[1]):
+            sorted_tracks[:, column] = tracks[order, column]
 
-                    tracks.append(struct.unpack("10f", data_bytes))
+        return sorted_tracks
 
-            if not tracks:
+    def _index_particle_tracks(self, tracks):
+        """
+        Extracts the particle IDs of the tracks and the rows of each particle type.
+
+        Args:
+            tracks (np.ndarray): (N, 10) array of particle tracks sorted by particle ID.
+        """
+        # Particle IDs are stored as floats in the track files
+        self._pid = tracks[:, self._col["particle_id"]].astype(np.int32)
+
+        unique_ids, starts = np.unique(self._pid, return_index=True)
+        stops = np.append(starts[1:], len(self._pid))
+        self._slice_of = dict(zip(unique_ids.tolist(), zip(starts.tolist(), stops.tolist())))
+
+    def _get_cache_state(self):
+        """
+        Describes the simulation files the cached data is based on.
+
+        Returns:
+            dict: Cache version and the name, modification time and size of each file.
+        """
+        files = {}
+        for key, path in self.file_paths.items():
+            if path is None:
+                files[key] = None
                 continue
 
-            # Form a pandas dataframe and discard nan entries
-            temp_df = pd.DataFrame(tracks, columns=columns).dropna(axis=1, how="all")
-            particle_tracks_df = pd.concat([particle_tracks_df, temp_df], ignore_index=True)
+            stat = os.stat(path)
+            files[key] = [os.path.basename(path), stat.st_mtime_ns, stat.st_size]
 
-        return particle_tracks_df
+        return {"version": _CACHE_VERSION, "files": files}
+
+    def _load_cache(self, cache_state):
+        """
+        Loads previously parsed data from the cache if the simulation files are unchanged.
+        The arrays are memory-mapped copy-on-write, so they are only read when accessed.
+
+        Args:
+            cache_state (dict): Current state of the simulation files as returned by
+                `_get_cache_state`.
+
+        Returns:
+            bool: `True` if the data was loaded from the cache.
+        """
+        try:
+            with open(os.path.join(self._path_cache, "state.json"), "r") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if state != cache_state:
+            return False
+
+        try:
+            cher_xy = np.load(os.path.join(self._path_cache, "cherenkov_impacts.npy"), mmap_mode="c")
+            tracks = np.load(os.path.join(self._path_cache, "particle_tracks.npy"), mmap_mode="c")
+        except (OSError, ValueError):
+            return False
+
+        print(f"\nLoading parsed data from cache '{self._path_cache}'")
+
+        self._cher_xy = cher_xy
+        self._tracks = tracks
+        self._index_particle_tracks(tracks)
+
+        return True
+
+    def _save_cache(self, cache_state):
+        """
+        Stores the parsed data in the cache. Failing to write the cache only
+        prints a warning.
+
+        Args:
+            cache_state (dict): State of the simulation files the data was parsed
+                from, as returned by `_get_cache_state` before parsing.
+        """
+        path_state = os.path.join(self._path_cache, "state.json")
+
+        try:
+            os.makedirs(self._path_cache, exist_ok=True)
+
+            # Invalidate the old cache first so that partially written files are never used
+            if os.path.exists(path_state):
+                os.remove(path_state)
+
+            self._replace_cache_file("cherenkov_impacts.npy", lambda f: np.save(f, self._cher_xy))
+            self._replace_cache_file("particle_tracks.npy", lambda f: np.save(f, self._tracks))
+
+            # The state is written last, it marks the arrays as complete
+            self._replace_cache_file("state.json", 
+                                     lambda f: f.write(json.dumps(cache_state).encode()))
+        except OSError as e:
+            print(f"Warning: Could not write cache to '{self._path_cache}': {e}")
+
+    def _replace_cache_file(self, name, write):
+        """
+        Writes a cache file to a temporary file and moves it into place. Instances
+        that memory-map the old file keep their mapping of the old inode, so it is
+        never truncated or changed underneath them.
+
+        Args:
+            name (str): Name of the file in the cache directory.
+            write (callable): Writes the content to the binary file object it is passed.
+        """
+        fd, path_tmp = tempfile.mkstemp(dir=self._path_cache, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(path_tmp, os.path.join(self._path_cache, name))
+        except BaseException:
+            os.remove(path_tmp)
+            raise
 
     def _cartesian_to_polar(self, x, y):
         """Convert Cartesian coordinates (x, y) to polar coordinates (r, theta)."""
@@ -238,18 +630,47 @@ class CorsikaPlotter:
         """        
         return np.pi*(r_outer**2 - r_inner**2)
     
-    def _get_showerstart_height(self):
+    @cached_property
+    def _track_segments_km(self):
+        """np.ndarray: (N, 2, 2) float32 start and end points of all tracks in the
+        x-z plane in km, computed once and in the same order as the tracks."""
+        segments = np.empty((len(self._tracks), 2, 2), dtype=np.float32)
+        segments[:, 0, 0] = self._tracks[:, self._col["x_start"]] * 1e-5
+        segments[:, 0, 1] = self._tracks[:, self._col["z_start"]] * 1e-5
+        segments[:, 1, 0] = self._tracks[:, self._col["x_end"]] * 1e-5
+        segments[:, 1, 1] = self._tracks[:, self._col["z_end"]] * 1e-5
+        return segments
+
+    def _get_track_segments(self, index):
+        """Selects the line segments of the x-z side view for the given tracks.
+
+        Args:
+            index (slice or np.ndarray): Slice, integer indices or boolean mask
+                selecting the tracks.
+
+        Returns:
+            np.ndarray: Array of shape (N, 2, 2) holding start and end points in km.
+                A slice returns a view without copying.
+        """
+        return self._track_segments_km[index]
+
+    @cached_property
+    def shower_start(self):
+        """float: Height a.s.l. in km at which the plots of the shower begin,
+        computed once from the particle height distribution."""
         # Identify meaningful shower start for plot via z-height distribution
         nparticles, hasl = np.histogram(
-            self.particle_tracks["z_start"] * 1e-5, bins=np.arange(0, 40, 1)
+            self._tracks[:, self._col["z_start"]] * 1e-5, bins=np.arange(0, 40, 1)
         )
         
-        # Flip arrays to start from higher altitudes going down
-        nparticles = np.flip(nparticles)
-        hasl = np.flip(hasl)
+        # Find the highest altitude bin in which more than 10 particles are involved
+        above_threshold = np.nonzero(nparticles > 10)[0]
+        if above_threshold.size == 0:
+            return hasl[-1]
         
-        # Begin Plot one step prior to when more than 10 particles are involved
-        shower_start = hasl[np.argmax(nparticles > 10) - 1]
+        # Begin Plot one step prior to it, i.e. one bin above its upper edge
+        # (clipped to the highest edge for showers starting at the very top)
+        shower_start = hasl[min(above_threshold[-1] + 2, len(hasl) - 1)]
         return shower_start 
     
     def plot_side_profile(self, ax=None, alpha=0.1, color_dict=None):
@@ -265,7 +686,7 @@ class CorsikaPlotter:
         Returns:
             matplotlib.axes.Axes: The axis containing the plot.
         """
-        shower_start = self._get_showerstart_height()
+        shower_start = self.shower_start
 
         if ax is None:
             _, ax = plt.subplots(figsize=(3, 8))
@@ -275,7 +696,7 @@ class CorsikaPlotter:
             color_dict = {}
 
         legend_handles = []
-        colored_particle_ids = []
+        colored_particle_ids = set()
         # Iterate over the provided colors and plot those separately
         for particle_name, color in color_dict.items():
             if particle_name not in self.particle_map:
@@ -283,18 +704,12 @@ class CorsikaPlotter:
                 continue
             
             particle_id = self.particle_map[particle_name]
-            colored_particle_ids.append(colored_particle_ids)
+            colored_particle_ids.add(particle_id)
             
-            subset = self.particle_tracks[self.particle_tracks["particle_id"] == particle_id]
-            
-            if subset.empty:
+            if particle_id not in self._slice_of:
                 continue
             
-            segments = np.array([
-                [[row["x_start"] * 1e-5, row["z_start"] * 1e-5],
-                [row["x_end"] * 1e-5, row["z_end"] * 1e-5]]
-                for _, row in subset.iterrows()
-            ])
+            segments = self._get_track_segments(slice(*self._slice_of[particle_id]))
             
             ax.add_collection(LineCollection(
                 segments, color=color, alpha=alpha, linewidth=0.2, label=particle_name, zorder=2
@@ -303,13 +718,20 @@ class CorsikaPlotter:
             # Add solid color line for legend
             legend_handles.append(plt.Line2D([0], [0], color=color, lw=2, label=particle_name))
         
-        # All other particle types segments will be shown in black
-        filtered_df = self.particle_tracks[~self.particle_tracks["particle_id"].isin(colored_particle_ids)].copy()
-        all_segments = np.array([
-            [[row["x_start"] * 1e-5, row["z_start"] * 1e-5],
-            [row["x_end"] * 1e-5, row["z_end"] * 1e-5]]
-            for _, row in filtered_df.iterrows()
-        ])
+        # All other particle types segments will be shown in black. As the tracks
+        # are grouped by particle ID, the colored ones are masked by their slices.
+        # The selection is reused as long as the colored particle types are the same
+        other_segments_key = frozenset(colored_particle_ids)
+        if self._other_segments_cache[0] != other_segments_key:
+            if colored_particle_ids:
+                other_tracks = np.ones(len(self._pid), dtype=bool)
+                for particle_id in colored_particle_ids:
+                    start, stop = self._slice_of.get(particle_id, (0, 0))
+                    other_tracks[start:stop] = False
+            else:
+                other_tracks = slice(None)
+            self._other_segments_cache = (other_segments_key, self._get_track_segments(other_tracks))
+        all_segments = self._other_segments_cache[1]
         ax.add_collection(LineCollection(
             all_segments, color="black", alpha=alpha, linewidth=0.08, zorder=1
         ))
@@ -340,34 +762,39 @@ class CorsikaPlotter:
         if ax is None:
             _, ax = plt.subplots(figsize=(5, 5))
 
+        # Photon distribution on the 2D plane, binned once and reused for
+        # both the colour scale estimate and the plot itself
+        nphotons, xedges, yedges = np.histogram2d(self._cher_xy[:, 0], 
+                                                  self._cher_xy[:, 1],
+                                                  bins = nbins
+        )
+
         # Calculate a guestimate for correct color-bar scale based on 
         # percentile containment
         if not vmax:
-            # Create preliminary histogram to get photon distribution on 2D plane
-            # Note: must have same settings as later plot histogram
-            nphotons, _, _ = np.histogram2d(self.cherenkov_photons['x_impact_cm']*1e-5, 
-                                            self.cherenkov_photons['y_impact_cm']*1e-5,
-                                            bins = nbins
-            )
-
             # Now we create a histogram of photons/pixel with wider binning
             (counts, photons_per_bin) = np.histogram(nphotons.flatten(), bins = 300)
             
             total_photons = counts.sum()
             
-            fractional_containment = [counts[:index].sum()/total_photons for index in range(len(counts))]
-            
-            vmax = photons_per_bin[np.argmin(np.abs(np.array(fractional_containment)-0.999999))]
+            # Containment below each lower bin edge; it is monotonic, so the
+            # threshold crossing can be located directly
+            cumulative_counts = np.cumsum(counts)
+            fractional_containment = np.concatenate(([0], cumulative_counts[:-1])) / total_photons
             
+            # Pick the lower edge whose containment is closest to the threshold and
+            # the first one of equal containment, like an argmin over all edges would
+            threshold = 0.999999
+            index = np.searchsorted(fractional_containment, threshold)
+            if index == len(counts) or (threshold - fractional_containment[index - 1] <= 
+                                        fractional_containment[index] - threshold):
+                index = np.searchsorted(fractional_containment, fractional_containment[index - 1])
+            vmax = photons_per_bin[index]
             
-        ax.hist2d(
-            self.cherenkov_photons["x_impact_cm"] * 1e-5,
-            self.cherenkov_photons["y_impact_cm"] * 1e-5,
-            bins=nbins,
-            vmin=0,
-            vmax=vmax,
-            cmap="binary",
-        )
+        # Same rendering as ax.hist2d, but without binning the photons again
+        ax.pcolormesh(xedges, yedges, nphotons.T, vmin=0, vmax=vmax, cmap="binary")
+        ax.set_xlim(xedges[0], xedges[-1])
+        ax.set_ylim(yedges[0], yedges[-1])
         ax.set_aspect("equal")
 
         return ax
@@ -391,34 +818,28 @@ class CorsikaPlotter:
             
         # Convert the impact Cartesian coordinates into polar coordinates 
         impact_r, _ = self._cartesian_to_polar(
-                        self.cherenkov_photons.x_impact_cm * 1e-2,
-                        self.cherenkov_photons.y_impact_cm * 1e-2
+                        self._cher_xy[:, 0] * 1e3,
+                        self._cher_xy[:, 1] * 1e3
         )
         
         # Setup logarithmic bins to calculate the photon density for
-        density_bins = np.logspace(
+        # Note: consecutive pairs of edges form the rings, i.e. the rings are
+        # (e0, e1), (e2, e3), ...
+        density_edges = np.logspace(
                                     np.log10(1),
                                     np.log10(800), 
                                     nbins
-        ).reshape((nbins//2,2))
+        )
+        inner_radius = density_edges[:-1:2]
+        outer_radius = density_edges[1::2]
     
-        # Open up lists to store the output 
-        photon_density = []
-        radial_bin_centre = []
+        # Bin all photons in one pass and keep only the ring bins
+        n_photons, _ = np.histogram(impact_r, bins=density_edges)
+        n_photons = n_photons[::2]
         
-        # Loop over all ring bins
-        for inner_radius, outer_radius in density_bins:
-            
-            # Calculate ring area and determine number of photons within it
-            area = self._ring_area(inner_radius, outer_radius) 
-            n_photons = ((impact_r < outer_radius) & (impact_r >= inner_radius)).sum()
-            
-            # Calculate photon density
-            photon_density.append(n_photons/area)
-            
-            # Calculate radial centre of the ring bin
-            bin_centre = (inner_radius +  outer_radius)/2.
-            radial_bin_centre.append(bin_centre)
+        # Calculate photon density and radial centre of the ring bins
+        photon_density = n_photons / self._ring_area(inner_radius, outer_radius)
+        radial_bin_centre = (inner_radius + outer_radius) / 2.
             
             
         plt.plot(radial_bin_centre, photon_density, c = color)
@@ -435,14 +856,17 @@ class CorsikaPlotter:
             _, ax = plt.subplots(figsize=(7, 4))
         
         # Get the height at which the shower started 
-        shower_start = self._get_showerstart_height()
+        shower_start = self.shower_start
             
         legend_handles = []
         
-        #plot distribution of all particles first
-        n_particles, bins = np.histogram(self.particle_tracks.z_start,
-                                        bins = np.arange(0,shower_start,0.1)*1e5)
+        # Height bins in cm shared by all histograms, with the same precision as
+        # the particle data so the heights are binned without conversion
+        bins = (np.arange(0,shower_start,0.1)*1e5).astype(np.float32)
         bin_centres = (bins[:-1]+bins[1:])/2.
+        
+        #plot distribution of all particles first
+        n_particles, _ = np.histogram(self._tracks[:, self._col["z_start"]], bins = bins)
 
         ax.plot(bin_centres *1e-5, n_particles, c = 'black')
         legend_handles.append(
@@ -463,35 +887,29 @@ class CorsikaPlotter:
                 # We get the subnames
                 subnames = particle_name.replace(' ', '').split('+')
                     
-                # Stores total number of particles for each color specification
-                all_particles = 0
+                # Collects the height of all particles for each color specification
+                group_z_start = []
                 group_name = ''
                 for name in subnames:
                     
                     # Yeah ... check if we even have the particle that have been 
                     # requested
                     if name not in self.particle_map:
-                        print(f"Warning: Unknown particle type '{name}'.")
-                        raise()
+                        raise ValueError(f"Unknown particle type '{name}'.")
                     
                     # Get the CORSIKA ID
                     particle_id = self.particle_map[name]
                     
                     # Select all entries with this particle ID
-                    subset = self.particle_tracks[self.particle_tracks["particle_id"] == particle_id]
-                    
-                    # Create the histogram 
-                    n_particles, bins = np.histogram(subset.z_start,
-                                                    bins = np.arange(0,shower_start,0.1)*1e5
-                    )
-                    
-                    # Add number of particles 
-                    all_particles += n_particles
+                    start, stop = self._slice_of.get(particle_id, (0, 0))
+                    group_z_start.append(self._tracks[start:stop, self._col["z_start"]])
                     
                     group_name += name + 's + '
+                    
+                # Create a single histogram for all particles of the group
+                all_particles, _ = np.histogram(np.concatenate(group_z_start), bins = bins)
+                
                 # Now we are done with all subnames and plot things 
-                bin_centres = (bins[:-1]+bins[1:])/2.
-
                 ax.plot(bin_centres *1e-5, all_particles, c = color)
                     
                     # Add solid color line for legend
@@ -1,5 +1,7 @@
 import os
 import random
+import shutil
+import subprocess
 from astropy import units as u
 import uuid
 
@@ -34,6 +36,9 @@ class CorsikaRunner:
         self.path_input_card_template = path_input_card_template
         self.temp_output_dir = None
 
+        # Content of the input card template, read on first use
+        self._template_content = None
+
         # The filled-out input card is stored in the local directory
         self.path_inputcard = os.path.join(os.getcwd(), "input_particletracks.inp")
 
@@ -144,8 +149,10 @@ class CorsikaRunner:
         Returns:
             str: The formatted input card content.
         """
-        with open(self.path_input_card_template, "r") as f:
-            template_content = f.read()
+        # The template does not change between runs, so it is only read once
+        if self._template_content is None:
+            with open(self.path_input_card_template, "r") as f:
+                self._template_content = f.read()
 
         # Generates a unique random folder name to store files in the 
         # CORSIKA directory
@@ -157,7 +164,7 @@ class CorsikaRunner:
         
         
         # Replace placeholders
-        template_content = template_content.format(
+        template_content = self._template_content.format(
             run_number=self.current_config["run_number"],
             seeds=self.current_config["seeds"],
             primary_particle=self.current_config["primary_particle"],
@@ -215,42 +222,47 @@ class CorsikaRunner:
     def run_simulation(self):
         """
         Calls the CORSIKA binary to run the simulation with user-defined parameters.
-        """
 
-        # Store the current working directory
-        _current_path = os.getcwd()
+        Raises:
+            subprocess.CalledProcessError: If CORSIKA exits with a non-zero status. The
+                output written so far, including `corsika_output.log`, is still copied
+                to the output directory.
+        """
 
-        # Change to the CORSIKA binary directory
-        os.chdir(os.path.dirname(self.path_corsika_executable))
+        # The CORSIKA binary has to be run from its own directory
+        _path_corsika_dir = os.path.dirname(os.path.abspath(self.path_corsika_executable))
+        _path_tmp_dir = os.path.join(_path_corsika_dir, self.temp_output_dir)
 
         # Make sure the temporary directory exists
-        os.makedirs(self.temp_output_dir, exist_ok=True)  # Create the folder
+        os.makedirs(_path_tmp_dir, exist_ok=True)  # Create the folder
         
         # Run the simulation
         print("Starting CORSIKA simulation (this may take a few minutes)...")
-        os.system(
-            f"{self.path_corsika_executable} < {self.path_inputcard} > "
-            f"{os.path.join(self.temp_output_dir, "corsika_output.log")}"
-        )
-        
-        print('Simulation has completed')
-        print('\t-> Copying files to user directory')
-        
-
-        # Restore the original working directory
-        os.chdir(_current_path)
-        
-        # Make sure the user output directory exists
-        os.makedirs(self.current_config["path_output"], exist_ok=True)  # Create the folder
-        
-        # Copy over files from temp directory to user-specified one 
-        _path_tmp_dir = os.path.join(os.path.dirname(self.path_corsika_executable), self.temp_output_dir)
-        os.system(
-            f"cp {_path_tmp_dir}/* {self.current_config["path_output"]}"
-        )
-        
-        print('\t-> Cleanup temporary working directory')
-        os.system(
-            f"rm -rf {_path_tmp_dir}"
-        )
-        
\ No newline at end of file
+        try:
+            with open(self.path_inputcard, "r") as f_input, \
+                    open(os.path.join(_path_tmp_dir, "corsika_output.log"), "w") as f_log:
+                subprocess.run(
+                    [os.path.abspath(self.path_corsika_executable)],
+                    stdin=f_input,
+                    stdout=f_log,
+                    cwd=_path_corsika_dir,
+                    check=True,
+                )
+            
+            print('Simulation has completed')
+        except subprocess.CalledProcessError:
+            _path_log = os.path.join(self.current_config["path_output"], "corsika_output.log")
+            print(f"Simulation failed, see the CORSIKA log in '{_path_log}'")
+            raise
+        finally:
+            # Note: the output is also kept if CORSIKA fails, the log is the only diagnostic
+            print('\t-> Copying files to user directory')
+            
+            # Make sure the user output directory exists
+            os.makedirs(self.current_config["path_output"], exist_ok=True)  # Create the folder
+            
+            # Copy over files from temp directory to user-specified one 
+            shutil.copytree(_path_tmp_dir, self.current_config["path_output"], dirs_exist_ok=True)
+            
+            print('\t-> Cleanup temporary working directory')
+            shutil.rmtree(_path_tmp_dir, ignore_errors=True)